@@ -1,100 +1,229 @@
-import requests
-import json
+import gzip
 import os
-from datetime import datetime
-from typing import List, Dict
+import sys
+from typing import List, Dict, Optional
+
+# orjson parses/serializes several times faster than stdlib json, which matters
+# for the multi-MB exchange symbol payload. Fall back to stdlib if unavailable.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj).encode()
+
+# ijson lets us walk the ~10k-entry exchange response item by item instead of
+# materializing the whole JSON tree alongside the filtered dicts
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+class StockInfo:
+    """Record for one symbol - a __slots__ class is ~4x smaller than an
+    equivalent 7-key dict and attribute access beats dict subscript"""
+
+    __slots__ = ('Code', 'Name', 'Country', 'Exchange', 'Currency', 'Type', 'Isin')
+
+    def __init__(self, Code, Name, Country, Exchange, Currency, Type, Isin):
+        self.Code = Code
+        self.Name = Name
+        self.Country = Country
+        self.Exchange = Exchange
+        self.Currency = Currency
+        self.Type = Type
+        self.Isin = Isin
+
+    def as_dict(self) -> Dict:
+        """Plain-dict view for callers that need a mapping"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self):
+        fields = ', '.join(f'{f}={getattr(self, f)!r}' for f in self.__slots__)
+        return f'StockInfo({fields})'
+
 
 class StockDataManager:
     """Manages stock data - fetches symbol list once and stores in memory"""
-    
-    CACHE_FILE = "stock_symbols_cache.json"
+
+    CACHE_FILE = "stock_symbols_cache.json.gz"
     API_KEY = "{Api-key}"
     EXCHANGE_CODE = "US"  # can use any Exchange Code but US is for all the tickers in US
-    
+
+    FIELDS = ('Code', 'Name', 'Country', 'Exchange', 'Currency', 'Type', 'Isin')
+    # These fields repeat across nearly all ~10k entries; interning collapses
+    # the duplicates into a handful of shared string objects
+    INTERNED_FIELDS = frozenset(('Country', 'Exchange', 'Currency', 'Type'))
+
     def __init__(self, force_refresh=False):
         """Initialize and load stock symbols into memory"""
-        self.stocks = {}  # Dictionary: {symbol: {Code, Name, Country, Exchange, Currency, Type, Isin}}
-        self.symbols = []  # List of all symbols for dropdown
+        # Columnar layout: one list per field plus a Code->row index. Far
+        # smaller than 10k 7-key dicts, and serializes as flat arrays.
+        self._columns = {field: [] for field in self.FIELDS}
+        self._idx = {}  # Dictionary: {symbol: row number}
+        self.symbols = self._columns['Code']  # List of all symbols for dropdown
+        # Validators from the last API response, for cheap conditional GETs
+        self._etag = None
+        self._last_modified = None
+        # HTTP session is created on first use (see _get_session)
+        self._session = None
         self.load_symbols(force_refresh)
-    
+
     def load_symbols(self, force_refresh=False):
         """Load symbols from cache or API"""
         if not force_refresh and os.path.exists(self.CACHE_FILE):
             print(f"Loading symbols from cache: {self.CACHE_FILE}")
             self._load_from_cache()
-        else:
+            # Revalidate against the server: a 304 keeps the cache with no
+            # payload download, a 200 means the list changed and is reparsed
+            if self.symbols and (self._etag or self._last_modified):
+                print("Revalidating cached symbol list...")
+                if self._fetch_from_api(conditional=True):
+                    self._save_to_cache()
+
+        if force_refresh or not self.symbols:
             print("Fetching symbols from API (one time only)...")
-            self._fetch_from_api()
-            self._save_to_cache()
-        
+            if self._fetch_from_api():
+                self._save_to_cache()
+
         print(f"Ready! Loaded {len(self.symbols)} symbols in memory")
-    
+
+    def _get_session(self):
+        """Create the HTTP session on first use
+
+        Reusing one session keeps the TCP/TLS connection alive between API
+        calls, and importing requests lazily means cache-hit startups skip
+        the urllib3/certifi import cost entirely.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            self._session = requests.Session()
+            self._session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        return self._session
+
     def _load_from_cache(self):
         """Load symbols from cache file"""
         try:
-            with open(self.CACHE_FILE, 'r') as f:
-                data = json.load(f)
-                self.stocks = data.get('stocks', {})
-                self.symbols = data.get('symbols', [])
+            with gzip.open(self.CACHE_FILE, 'rb') as f:
+                data = _loads(f.read())
+            columns = data.get('columns', {})
+            if columns:
+                self._columns = {field: columns.get(field, []) for field in self.FIELDS}
+                for field in self.INTERNED_FIELDS:
+                    self._columns[field] = [sys.intern(v) if isinstance(v, str) else v
+                                            for v in self._columns[field]]
+                self.symbols = self._columns['Code']
+                # The Code->row index is derived, not stored: rebuilding it is
+                # a single enumerate pass and keeps it out of the cache file
+                self._idx = {code: row for row, code in enumerate(self.symbols)}
+                self._etag = data.get('etag')
+                self._last_modified = data.get('last_modified')
                 print(f"Loaded {len(self.symbols)} symbols from cache")
         except Exception as e:
             print(f"Error loading cache: {e}")
-    
+
     def _save_to_cache(self):
         """Save symbols to cache file"""
+        from datetime import datetime
         try:
             data = {
-                'stocks': self.stocks,
-                'symbols': self.symbols,
+                'columns': self._columns,
+                'etag': self._etag,
+                'last_modified': self._last_modified,
                 'cached_at': datetime.now().isoformat()
             }
-            with open(self.CACHE_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Text-heavy JSON compresses ~10x; level 3 keeps the write cheap
+            with gzip.open(self.CACHE_FILE, 'wb', compresslevel=3) as f:
+                f.write(_dumps(data))
             print(f"Cached {len(self.symbols)} symbols to {self.CACHE_FILE}")
         except Exception as e:
             print(f"Error saving cache: {e}")
-    
-    def _fetch_from_api(self):
-        """Fetch symbols from API (ONE TIME ONLY)"""
+
+    def _fetch_from_api(self, conditional=False):
+        """Fetch symbols from API, or revalidate the cache if `conditional`
+
+        Returns True when a fresh symbol list was parsed, False when the
+        cached copy is still valid (304) or the request failed.
+        """
         try:
             url = f'https://eodhd.com/api/exchange-symbol-list/{self.EXCHANGE_CODE}?api_token={self.API_KEY}&fmt=json'
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                symbols_data = response.json()
-                
-                # Extract only the fields we need
+            headers = None
+            if conditional:
+                if self._etag:
+                    headers = {'If-None-Match': self._etag}
+                elif self._last_modified:
+                    headers = {'If-Modified-Since': self._last_modified}
+            response = self._get_session().get(url, timeout=30, stream=True, headers=headers)
+
+            if response.status_code == 304:
+                print("Symbol list unchanged on server; keeping cache")
+            elif response.status_code == 200:
+                self._etag = response.headers.get('ETag')
+                self._last_modified = response.headers.get('Last-Modified')
+                if ijson is not None:
+                    # Stream items off the wire one at a time to keep peak
+                    # memory at a single entry instead of the full payload.
+                    # response.raw is the undecoded body; tell urllib3 to
+                    # gunzip it so ijson sees JSON, not gzip bytes.
+                    response.raw.decode_content = True
+                    symbols_data = ijson.items(response.raw, 'item')
+                else:
+                    # Parse the raw bytes directly; skips the str decode that
+                    # response.json() would do on a multi-MB payload
+                    symbols_data = _loads(response.content)
+
+                # Extract only the fields we need, one column append each,
+                # into fresh lists - the live table is swapped in only after
+                # the whole payload parses, so a mid-stream failure can't
+                # leave a truncated or empty table behind. Column lists and
+                # intern flags are bound outside the loop so each of the
+                # ~10k items costs one hashed lookup per field.
+                new_columns = {field: [] for field in self.FIELDS}
+                new_idx = {}
+                code_col = new_columns['Code']
+                rest = [(field, new_columns[field], field in self.INTERNED_FIELDS)
+                        for field in self.FIELDS[1:]]
                 for item in symbols_data:
-                    code = item.get('Code')
-                    self.stocks[code] = {
-                        'Code': item.get('Code'),
-                        'Name': item.get('Name'),
-                        'Country': item.get('Country'),
-                        'Exchange': item.get('Exchange'),
-                        'Currency': item.get('Currency'),
-                        'Type': item.get('Type'),
-                        'Isin': item.get('Isin')
-                    }
-                
-                self.symbols = list(self.stocks.keys())
+                    code = item['Code']
+                    new_idx[code] = len(code_col)
+                    code_col.append(code)
+                    for field, col, intern_it in rest:
+                        value = item.get(field)
+                        if intern_it and isinstance(value, str):
+                            value = sys.intern(value)
+                        col.append(value)
+
+                # Release the parsed payload before building anything else
+                del symbols_data
+                self._columns = new_columns
+                self._idx = new_idx
+                self.symbols = self._columns['Code']
                 print(f"Fetched {len(self.symbols)} symbols from API")
+                return True
             else:
                 print(f"Error fetching symbols: Status {response.status_code}")
         except Exception as e:
             print(f"Error fetching from API: {e}")
-    
+        return False
+
     def get_symbols(self) -> List[str]:
         """Get list of all symbols from memory"""
         return self.symbols
-    
-    def get_stock_info(self, symbol: str) -> Dict:
-        """Get stock info from memory (no API call)"""
-        return self.stocks.get(symbol, {})
-    
-    def get_all_stocks(self) -> Dict:
-        """Get all stocks info"""
-        return self.stocks
-    
+
+    def get_stock_info(self, symbol: str) -> Optional[StockInfo]:
+        """Get stock info from memory (no API call); None if unknown"""
+        row = self._idx.get(symbol)
+        if row is None:
+            return None
+        return StockInfo(*(self._columns[field][row] for field in self.FIELDS))
+
+    def get_all_stocks(self) -> Dict[str, StockInfo]:
+        """Get all stocks info (built on demand from the columns)"""
+        return {symbol: self.get_stock_info(symbol) for symbol in self.symbols}
+
     def refresh_symbols(self):
         """Force refresh symbols from API"""
         print("Refreshing symbols from API...")
@@ -106,7 +235,7 @@ if __name__ == "__main__":
     # First time: fetches symbols from API and caches (ONE TIME ONLY)
     manager = StockDataManager()
     print(f"\nAvailable symbols: {manager.get_symbols()[:10]}")  # Show first 10
-    
+
     # Get info from memory (no API call)
     stock_info = manager.get_stock_info("AAPL")
-    print(f"\nAAPL Info (from memory): {stock_info}")
\ No newline at end of file
+    print(f"\nAAPL Info (from memory): {stock_info}")
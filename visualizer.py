@@ -1,18 +1,20 @@
-from datetime import datetime, timedelta
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import functools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import List, Dict
-import random
+import numpy as np
 import tkinter as tk
-from tkinter import ttk
 import requests
 from stock_data_manager import StockDataManager
 
 class StockReport:
+    MAX_MATCHES = 50  # cap the autocomplete popup; Tk can't virtualize 10k rows
+
     def __init__(self, root, data_manager: StockDataManager):
         self.stocks: List[Dict] = []
+        self.symbols: List[str] = []  # loaded symbols, in add order
+        self._symbol_to_idx: Dict[str, int] = {}  # symbol -> index into self.stocks
         self.selected_stock = 0
         self.root = root
         self.data_manager = data_manager
@@ -26,10 +28,22 @@ class StockReport:
         
         tk.Label(top_frame, text="Select Stock:", font=("Arial", 12, "bold")).pack(side=tk.LEFT, padx=5)
         
+        # Autocomplete entry + popup listbox: a Combobox loaded with 10k
+        # symbols stalls for hundreds of ms rebuilding its popdown, so we
+        # filter as the user types and only ever show MAX_MATCHES rows
+        self.available_symbols: List[str] = []
+        self._prefix_index: Dict[str, List[str]] = {}
         self.stock_var = tk.StringVar()
-        self.dropdown = ttk.Combobox(top_frame, textvariable=self.stock_var, state="readonly", font=("Arial", 11), width=15)
-        self.dropdown.pack(side=tk.LEFT, padx=5)
-        self.dropdown.bind("<<ComboboxSelected>>", self.on_stock_selected)
+        self.entry = tk.Entry(top_frame, textvariable=self.stock_var, font=("Arial", 11), width=15)
+        self.entry.pack(side=tk.LEFT, padx=5)
+        self.entry.bind("<KeyRelease>", self._on_search_typed)
+        self.entry.bind("<Return>", self._on_match_chosen)
+        self.entry.bind("<Escape>", lambda event: self.match_list.place_forget())
+        self.entry.bind("<Up>", self._on_arrow_key)
+        self.entry.bind("<Down>", self._on_arrow_key)
+
+        self.match_list = tk.Listbox(root, font=("Arial", 11))
+        self.match_list.bind("<<ListboxSelect>>", self._on_match_chosen)
         
         # Close button
         close_btn = tk.Button(top_frame, text="Close", command=self.on_closing, font=("Arial", 10), bg="red", fg="white")
@@ -45,9 +59,15 @@ class StockReport:
         # Create frame for matplotlib
         self.canvas_frame = tk.Frame(root)
         self.canvas_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Figure/canvas are created lazily in _ensure_canvas so the window
+        # appears before matplotlib's ~300ms import is paid
+        self.fig = None
+        self.ax = None
+        self.canvas = None
     
     def add_stock(self, symbol: str, price: float, change: float, 
-                  volume: int, market_cap: str, historical_prices: List[float] = None):
+                  volume: int, market_cap: str, historical_prices: np.ndarray = None):
         """Add a stock to the report"""
         self.stocks.append({
             'symbol': symbol,
@@ -55,15 +75,22 @@ class StockReport:
             'change': change,
             'volume': volume,
             'market_cap': market_cap,
-            'historical_prices': historical_prices or []
+            # `is not None` rather than truthiness: arrays are ambiguous there
+            'historical_prices': historical_prices if historical_prices is not None else []
         })
+        self.symbols.append(symbol)
+        self._symbol_to_idx[symbol] = len(self.stocks) - 1
     
-    def _format_currency(self, value: float) -> str:
-        """Format as currency"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_currency(value: float) -> str:
+        """Format as currency (memoized - prices repeat across redraws)"""
         return f"${value:,.2f}"
-    
-    def _format_volume(self, volume: int) -> str:
-        """Format volume with K/M notation"""
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_volume(volume: int) -> str:
+        """Format volume with K/M notation (memoized)"""
         if volume >= 1_000_000:
             return f"{volume/1_000_000:.2f}M"
         elif volume >= 1_000:
@@ -76,32 +103,117 @@ class StockReport:
         self.root.destroy()
     
     def populate_dropdown(self, available_symbols: List[str] = None):
-        """Populate dropdown with stock symbols"""
-        if available_symbols:
-            self.dropdown['values'] = available_symbols
-            if available_symbols:
-                self.dropdown.set(available_symbols[0])
+        """Load the symbol catalog searched by the autocomplete entry"""
+        symbols = available_symbols if available_symbols is not None else self.symbols
+        if not symbols:
+            return
+        self.available_symbols = symbols
+        # Bucket by the first two characters so a keystroke only scans
+        # its bucket instead of the whole catalog
+        self._prefix_index = defaultdict(list)
+        for symbol in symbols:
+            self._prefix_index[symbol[:2].upper()].append(symbol)
+        self.stock_var.set(symbols[0])
+        if available_symbols is None:
+            self.selected_stock = 0
+            self.update_display()
+
+    def _find_matches(self, query: str) -> List[str]:
+        """First MAX_MATCHES symbols starting with query (case-insensitive)"""
+        query = query.upper()
+        if len(query) >= 2:
+            candidates = self._prefix_index.get(query[:2], [])
         else:
-            symbols = [stock['symbol'] for stock in self.stocks]
-            self.dropdown['values'] = symbols
-            if symbols:
-                self.dropdown.set(symbols[0])
-                self.selected_stock = 0
-                self.update_display()
-    
-    def on_stock_selected(self, event):
-        """Handle stock selection from dropdown"""
-        selected_symbol = self.stock_var.get()
-        for idx, stock in enumerate(self.stocks):
-            if stock['symbol'] == selected_symbol:
-                self.selected_stock = idx
-                self.update_display()
+            candidates = self.available_symbols
+        matches = []
+        for symbol in candidates:
+            if symbol.upper().startswith(query):
+                matches.append(symbol)
+                if len(matches) >= self.MAX_MATCHES:
+                    break
+        return matches
+
+    def _on_search_typed(self, event):
+        """Refresh the match popup as the user types"""
+        if event.keysym in ('Return', 'Up', 'Down', 'Escape'):
+            return
+        query = self.stock_var.get().strip()
+        if not query:
+            self.match_list.place_forget()
+            return
+        matches = self._find_matches(query)
+        self.match_list.delete(0, tk.END)
+        for symbol in matches:
+            self.match_list.insert(tk.END, symbol)
+        if matches:
+            self.match_list.configure(height=min(len(matches), 8))
+            self.match_list.place(in_=self.entry, relx=0, rely=1.0, relwidth=1.5)
+            self.match_list.lift()
+        else:
+            self.match_list.place_forget()
+
+    def _on_arrow_key(self, event):
+        """Move the popup selection with Up/Down while typing in the entry"""
+        size = self.match_list.size()
+        if not size or not self.match_list.winfo_ismapped():
+            return None
+        selection = self.match_list.curselection()
+        current = selection[0] if selection else -1
+        step = 1 if event.keysym == 'Down' else -1
+        new = max(0, min(size - 1, current + step))
+        self.match_list.selection_clear(0, tk.END)
+        self.match_list.selection_set(new)
+        self.match_list.activate(new)
+        self.match_list.see(new)
+        return "break"  # keep the Entry from also moving its cursor
+
+    def _on_match_chosen(self, event=None):
+        """Commit a symbol from the popup (click) or the entry (Return)"""
+        selection = self.match_list.curselection()
+        if selection:
+            symbol = self.match_list.get(selection[0])
+        else:
+            matches = self._find_matches(self.stock_var.get().strip())
+            if not matches:
                 return
-        
+            symbol = matches[0]
+        self.stock_var.set(symbol)
+        self.match_list.place_forget()
+        self.on_stock_selected()
+
+    def on_stock_selected(self, event=None):
+        """Handle stock selection from the autocomplete"""
+        selected_symbol = self.stock_var.get()
+        idx = self._symbol_to_idx.get(selected_symbol)
+        if idx is not None:
+            self.selected_stock = idx
+            self.update_display()
+            return
+
         # If stock not in list, add it from memory
         print(f"Loading {selected_symbol} from memory...")
         self.load_stock_from_memory(selected_symbol)
     
+    def _ensure_canvas(self):
+        """Create the figure/canvas on first render
+
+        matplotlib is imported here rather than at module level so startup
+        shows the UI immediately; the import cost lands on the first chart,
+        overlapped with the user picking a symbol.
+        """
+        if self.canvas is not None:
+            return
+        import matplotlib
+        matplotlib.use('TkAgg')
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        # One figure/canvas for the lifetime of the window; selections just
+        # clear and redraw the axes instead of rebuilding Tk widgets
+        self.fig, self.ax = plt.subplots(figsize=(10, 5))
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.canvas_frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
     def update_display(self):
         """Update the chart and info display"""
         stock = self.stocks[self.selected_stock]
@@ -113,27 +225,20 @@ class StockReport:
                     f"Volume: {self._format_volume(stock['volume'])}  |  "
                     f"Market Cap: {stock['market_cap']}")
         self.info_label.config(text=info_text)
-        
-        # Clear previous canvas
-        for widget in self.canvas_frame.winfo_children():
-            widget.destroy()
-        
-        # Create new figure
-        fig, ax = plt.subplots(figsize=(10, 5))
-        self.plot_stock(ax, stock)
-        
-        # Embed matplotlib in tkinter
-        canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Redraw into the existing axes/canvas
+        self._ensure_canvas()
+        self.ax.clear()
+        self.plot_stock(self.ax, stock)
+        self.canvas.draw_idle()
     
     def plot_stock(self, ax, stock):
         """Plot a single stock"""
         prices = stock['historical_prices']
-        
-        # Generate dates for x-axis (last 30 days)
-        dates = [(datetime.now() - timedelta(days=30-i)).strftime('%m/%d') for i in range(30)]
-        
+
+        # Date labels for x-axis (cached - they only change once per day)
+        dates, tick_positions, tick_labels = _date_axis(date.today(), len(prices))
+
         # Plot line
         ax.plot(range(len(prices)), prices, linewidth=2, marker='o', markersize=5, 
                 color='#1f77b4', label=stock['symbol'])
@@ -146,16 +251,15 @@ class StockReport:
         ax.grid(True, alpha=0.3)
         
         # Show every 5th date label
-        tick_positions = range(0, len(prices), 5)
-        tick_labels = [dates[i] if i < len(dates) else '' for i in tick_positions]
         ax.set_xticks(tick_positions)
         ax.set_xticklabels(tick_labels, rotation=45, fontsize=10)
         
-        # Add min/max annotations
-        min_price = min(prices)
-        max_price = max(prices)
-        min_idx = prices.index(min_price)
-        max_idx = prices.index(max_price)
+        # Add min/max annotations (argmin/argmax find value and index in one pass)
+        arr = np.asarray(prices)
+        min_idx = int(arr.argmin())
+        max_idx = int(arr.argmax())
+        min_price = arr[min_idx]
+        max_price = arr[max_idx]
         
         ax.plot(min_idx, min_price, 'ro', markersize=10, label='Lowest')
         ax.plot(max_idx, max_price, 'go', markersize=10, label='Highest')
@@ -214,13 +318,27 @@ class StockReport:
             print(f"Error fetching {symbol}: {e}")
 
 
-def generate_historical_data(current_price: float, days: int = 30) -> List[float]:
-    """Generate realistic historical price data"""
-    prices = [current_price]
-    for _ in range(days - 1):
-        change = random.uniform(-2, 2)
-        new_price = prices[-1] * (1 + change / 100)
-        prices.insert(0, new_price)
+@functools.lru_cache(maxsize=8)
+def _date_axis(today: date, n: int):
+    """Build the last-n-days date labels and every-5th tick marks.
+
+    Cached so selection changes reuse the same labels; the key only
+    rolls over at midnight or when the window length changes.
+    """
+    dates = [(today - timedelta(days=n - i)).strftime('%m/%d') for i in range(n)]
+    tick_positions = tuple(range(0, n, 5))
+    tick_labels = tuple(dates[i] for i in tick_positions)
+    return dates, tick_positions, tick_labels
+
+
+def generate_historical_data(current_price: float, days: int = 30) -> np.ndarray:
+    """Generate realistic historical price data ending at current_price"""
+    # Vectorized random walk: daily factors in [-2%, +2%], walked backwards
+    # from today so the series lands exactly on the current price
+    changes = np.random.uniform(-0.02, 0.02, size=days - 1)
+    prices = np.empty(days)
+    prices[-1] = current_price
+    prices[:-1] = current_price / np.cumprod(1.0 + changes)[::-1]
     return prices
 
 
@@ -267,25 +385,42 @@ def create_report_from_api(root, api_data: List[Dict]):
     return report
 
 # Update the API URL
-def fetch_stock_data(symbols: List[str], api_key: str) -> List[Dict]:
-    """Fetch stock data from EODHD API for given symbols"""
-    stock_data = []
-    base_url = "https://eodhd.com/api/real-time/{symbol}.US"
-    
-    for symbol in symbols:
-        try:
-            url = f"{base_url.format(symbol=symbol)}?api_token={api_key}&fmt=json"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                stock_data.append(data)
-                print(f"Fetched data for {symbol}")
-            else:
-                print(f"Error fetching {symbol}: Status {response.status_code}")
-        except Exception as e:
-            print(f"Error fetching {symbol}: {e}")
-    
-    return stock_data
+# EODHD's real-time endpoint accepts extra tickers via the `s` parameter,
+# so one request can cover a whole chunk of symbols
+_BATCH_SIZE = 20
+
+
+def _fetch_chunk(http, chunk: List[str], api_key: str) -> List[Dict]:
+    """Fetch real-time data for up to _BATCH_SIZE symbols in one request"""
+    params = {'api_token': api_key, 'fmt': 'json'}
+    if len(chunk) > 1:
+        params['s'] = ','.join(f"{symbol}.US" for symbol in chunk[1:])
+    try:
+        response = http.get(f"https://eodhd.com/api/real-time/{chunk[0]}.US",
+                            params=params, timeout=30)
+        if response.status_code == 200:
+            data = response.json()
+            print(f"Fetched data for {len(chunk)} symbols")
+            # Single-symbol requests return an object, batches an array
+            return data if isinstance(data, list) else [data]
+        print(f"Error fetching {', '.join(chunk)}: Status {response.status_code}")
+    except Exception as e:
+        print(f"Error fetching {', '.join(chunk)}: {e}")
+    return []
+
+
+def fetch_stock_data(symbols: List[str], api_key: str, session: requests.Session = None) -> List[Dict]:
+    """Fetch stock data from EODHD API for given symbols
+
+    Symbols are batched _BATCH_SIZE per request through the bulk endpoint,
+    and the chunks are fetched concurrently over the shared keep-alive
+    session - 100 symbols cost 5 requests instead of 100.
+    """
+    http = session or requests
+    chunks = [symbols[i:i + _BATCH_SIZE] for i in range(0, len(symbols), _BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = executor.map(lambda c: _fetch_chunk(http, c, api_key), chunks)
+    return [data for batch in results for data in batch]
 
 
 def main():